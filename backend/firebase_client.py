@@ -9,6 +9,10 @@ control. Typical usage:
     db = get_firestore_client()
     doc = db.collection("teams").document("team-123").get()
 
+Async code paths can use get_async_firestore_client() instead, which returns a
+google.cloud.firestore.AsyncClient suitable for awaiting directly on the event
+loop.
+
 The module supports three credential loading strategies, in priority order:
 1. FIREBASE_SERVICE_ACCOUNT_BASE64: base64 encoded service account JSON string.
 2. GOOGLE_APPLICATION_CREDENTIALS: path to a service account JSON file.
@@ -21,13 +25,13 @@ connect to the emulator instance instead of the live service.
 from __future__ import annotations
 
 import base64
-import json
 import os
 from functools import lru_cache
 from typing import Dict, Optional
 
 import firebase_admin
-from firebase_admin import credentials, firestore
+import orjson
+from firebase_admin import credentials, firestore, firestore_async
 
 CredentialDict = Dict[str, object]
 
@@ -41,10 +45,9 @@ def _load_service_account() -> Optional[credentials.Certificate]:
     raw_base64 = os.getenv("FIREBASE_SERVICE_ACCOUNT_BASE64")
     if raw_base64:
         try:
-            decoded = base64.b64decode(raw_base64).decode("utf-8")
-            data: CredentialDict = json.loads(decoded)
+            data: CredentialDict = orjson.loads(base64.b64decode(raw_base64))
             return credentials.Certificate(data)
-        except (ValueError, json.JSONDecodeError) as exc:
+        except ValueError as exc:  # covers binascii.Error and orjson.JSONDecodeError
             raise FirebaseInitializationError(
                 "Invalid FIREBASE_SERVICE_ACCOUNT_BASE64 value."
             ) from exc
@@ -52,11 +55,12 @@ def _load_service_account() -> Optional[credentials.Certificate]:
     credential_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
     if credential_path:
         expanded_path = os.path.expanduser(credential_path)
-        if not os.path.exists(expanded_path):
+        try:
+            return credentials.Certificate(expanded_path)
+        except FileNotFoundError as exc:
             raise FirebaseInitializationError(
                 f"Service account file not found at {expanded_path}."
-            )
-        return credentials.Certificate(expanded_path)
+            ) from exc
 
     # Fallback to default credentials (e.g., when running on Cloud infrastructure)
     return None
@@ -105,8 +109,16 @@ def get_firestore_client() -> firestore.Client:
     return firestore.client(app=app)
 
 
+@lru_cache(maxsize=1)
+def get_async_firestore_client() -> firestore_async.AsyncClient:
+    """Return a cached asyncio Firestore client sharing the Firebase App credentials."""
+    app = get_firebase_app()
+    return firestore_async.client(app=app)
+
+
 __all__ = [
     "FirebaseInitializationError",
+    "get_async_firestore_client",
     "get_firebase_app",
     "get_firestore_client",
 ]
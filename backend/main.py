@@ -9,24 +9,33 @@ This software may not be copied, modified, distributed, or used without explicit
 """
 
 import asyncio
-import json
+import hashlib
+import heapq
 import logging
 import os
 import random
 import string
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from firebase_admin import firestore as admin_firestore
 from google.cloud import exceptions
+from google.cloud.firestore_v1.base_query import FieldFilter
 from pydantic import BaseModel
 
 # Import the ML model for bounty assignment
 from ml_model import assign_bounty as ml_assign_bounty
 from firebase_client import (
     FirebaseInitializationError,
+    get_async_firestore_client,
     get_firestore_client,
 )
 
@@ -34,10 +43,20 @@ from firebase_client import (
 # FastAPI App Initialization
 # ============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open Firestore clients and read fallback fixtures before serving requests."""
+    init_firestore(app)
+    load_fallback_datasets(app)
+    yield
+
+
 app = FastAPI(
     title="BountyAI Backend",
     description="AI-powered bounty assignment system for teams",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ============================================================================
@@ -92,15 +111,15 @@ def load_json_file(file_path: str) -> List[Dict]:
     """Load JSON data from a file."""
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Data file not found: {file_path}")
-    with open(file_path, 'r') as f:
-        return json.load(f)
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
 
 
 def save_json_file(file_path: str, data: List[Dict]) -> None:
     """Save JSON data to a file."""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    with open(file_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
 
 # Firestore helpers ----------------------------------------------------------
@@ -108,37 +127,153 @@ def save_json_file(file_path: str, data: List[Dict]) -> None:
 logger = logging.getLogger(__name__)
 
 DEFAULT_TENANT_ID = os.getenv("FIREBASE_DEFAULT_TENANT_ID", "default")
+DATASET_CACHE_TTL = float(os.getenv("BOUNTYAI_DATASET_TTL", "60"))
+
+TEAMS_JSON_PATH = "data/teams.json"
+PROJECTS_JSON_PATH = "data/projects.json"
+
+# Process-local cache of tenant collections: (tenant, collection) -> (expiry, records)
+_dataset_cache: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = {}
+_dataset_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+# Last ETag per dataset, keyed on the identity of the (cached) records list
+_dataset_etags: Dict[str, Tuple[List[Dict], str]] = {}
+
+# Caps concurrent Firestore RPCs so bursts don't hit gRPC "Deadline Exceeded"
+FIRESTORE_SEMAPHORE = asyncio.Semaphore(int(os.getenv("FIRESTORE_MAX_INFLIGHT", "16")))
+
+# Assignment results waiting to be written; each takes 3 of a batch's 500 writes
+_pending_assignments: List[Tuple[str, Dict]] = []
+MAX_ASSIGNMENTS_PER_BATCH = 500 // 3
+
+
+def _firestore_client():
+    """Return the Firestore client opened at startup, initializing it lazily otherwise."""
+    db = getattr(app.state, "db", None)
+    return db if db is not None else get_firestore_client()
+
+
+def _async_firestore_client():
+    """Async counterpart of _firestore_client()."""
+    db = getattr(app.state, "async_db", None)
+    return db if db is not None else get_async_firestore_client()
+
+
+@dataclass(frozen=True)
+class TenantRefs:
+    """Pre-built references for a tenant document and its main collections."""
+    document: Any
+    teams: Any
+    projects: Any
+
+    @classmethod
+    def for_tenant(cls, db: Any, tenant_id: str) -> "TenantRefs":
+        document = db.collection("tenants").document(tenant_id)
+        return cls(
+            document=document,
+            teams=document.collection("teams"),
+            projects=document.collection("projects"),
+        )
+
+    def collection(self, collection_name: str) -> Any:
+        if collection_name == "teams":
+            return self.teams
+        if collection_name == "projects":
+            return self.projects
+        return self.document.collection(collection_name)
+
+
+@lru_cache(maxsize=128)
+def _tenant_refs(tenant_id: str) -> TenantRefs:
+    """Memoized tenant references on the sync client (used in worker threads)."""
+    return TenantRefs.for_tenant(_firestore_client(), tenant_id)
+
+
+@lru_cache(maxsize=128)
+def _async_tenant_refs(tenant_id: str) -> TenantRefs:
+    """Memoized tenant references on the async client."""
+    return TenantRefs.for_tenant(_async_firestore_client(), tenant_id)
 
 
 def _ensure_document_id(data: Dict, document_id: str) -> Dict:
+    """Add the document id to a snapshot dict in place (to_dict() returns a fresh copy)."""
     if "id" not in data:
-        data = {**data, "id": document_id}
+        data["id"] = document_id
     return data
 
 
-async def _fetch_tenant_collection(collection_name: str) -> List[Dict]:
-    """Retrieve a collection under the tenant document from Firestore."""
+async def _fetch_tenant_collection(
+    collection_name: str,
+    field_paths: Optional[List[str]] = None,
+) -> List[Dict]:
+    """Retrieve a collection under the tenant document from Firestore.
 
-    def _fetch() -> List[Dict]:
-        db = get_firestore_client()
-        collection_ref = (
-            db.collection("tenants")
-            .document(DEFAULT_TENANT_ID)
-            .collection(collection_name)
-        )
-        documents = collection_ref.stream()
+    Uses the asyncio client so concurrent loads (e.g. teams and projects) share
+    one gRPC channel on the event loop instead of each occupying a worker thread.
+    When ``field_paths`` is given only those fields are transferred.
+    """
+    collection_ref = _async_tenant_refs(DEFAULT_TENANT_ID).collection(collection_name)
+    query = collection_ref.select(field_paths) if field_paths else collection_ref
+    async with FIRESTORE_SEMAPHORE:
         return [
             _ensure_document_id(doc.to_dict() or {}, doc.id)
-            for doc in documents
+            async for doc in query.stream()
         ]
 
-    return await asyncio.to_thread(_fetch)
 
+def invalidate_dataset(collection_name: str, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+    """Expire a cached collection so the next read goes back to Firestore."""
+    key = (tenant_id, collection_name)
+    cached = _dataset_cache.get(key)
+    if cached is not None:
+        _dataset_cache[key] = (0.0, cached[1])
+
+
+def _cached_records(collection_name: str) -> Optional[List[Dict]]:
+    """Return the cached collection if it has not expired yet."""
+    cached = _dataset_cache.get((DEFAULT_TENANT_ID, collection_name))
+    if cached is not None and time.monotonic() < cached[0]:
+        return cached[1]
+    return None
+
+
+async def _load_cached_collection(collection_name: str) -> List[Dict]:
+    """Return a tenant collection, re-fetching from Firestore once the TTL lapses."""
+    records = _cached_records(collection_name)
+    if records is not None:
+        return records
+
+    key = (DEFAULT_TENANT_ID, collection_name)
+    lock = _dataset_locks.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another request may have refreshed the entry while we waited
+        records = _cached_records(collection_name)
+        if records is not None:
+            return records
 
-async def load_dataset(collection_name: str, json_path: str) -> List[Dict]:
-    """Attempt to load dataset from Firestore, falling back to local JSON."""
-    try:
         records = await _fetch_tenant_collection(collection_name)
+        if records:
+            _dataset_cache[key] = (time.monotonic() + DATASET_CACHE_TTL, records)
+        return records
+
+
+async def load_dataset(
+    collection_name: str,
+    json_path: str,
+    field_paths: Optional[List[str]] = None,
+) -> List[Dict]:
+    """Attempt to load dataset from Firestore, falling back to local JSON.
+
+    Passing ``field_paths`` requests a projection: a warm cache entry is reused
+    as-is, otherwise only the listed fields are fetched (and not cached).
+    """
+    try:
+        if field_paths:
+            records = _cached_records(collection_name)
+            if records is None:
+                records = await _fetch_tenant_collection(collection_name, field_paths)
+        else:
+            records = await _load_cached_collection(collection_name)
         if records:
             return records
         logger.info(
@@ -153,38 +288,56 @@ async def load_dataset(collection_name: str, json_path: str) -> List[Dict]:
     except Exception as exc:  # pylint: disable=broad-except
         logger.error("Unexpected error retrieving %s: %s", collection_name, exc)
 
+    fallback = getattr(app.state, "fallback_datasets", {}).get(json_path)
+    if fallback is not None:
+        return fallback
     return load_json_file(json_path)
 
 
+def dataset_etag(collection_name: str, records: List[Dict]) -> str:
+    """Return a strong ETag for a dataset, recomputed only when the list changes."""
+    cached = _dataset_etags.get(collection_name)
+    if cached is not None and cached[0] is records:
+        return cached[1]
+    digest = hashlib.blake2b(orjson.dumps(records, default=str), digest_size=8).hexdigest()
+    etag = f'"{digest}"'
+    _dataset_etags[collection_name] = (records, etag)
+    return etag
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _dataset_cache_headers(etag: str) -> Dict[str, str]:
+    """Validator headers shared by a dataset's 200 and 304 responses."""
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
 async def load_teams() -> List[Dict]:
-    return await load_dataset("teams", "data/teams.json")
+    return await load_dataset("teams", TEAMS_JSON_PATH)
 
 
 async def load_projects() -> List[Dict]:
-    return await load_dataset("projects", "data/projects.json")
-
+    return await load_dataset("projects", PROJECTS_JSON_PATH)
 
-async def _fetch_existing_join_codes(tenant_id: str) -> Set[str]:
-    def _fetch() -> Set[str]:
-        db = get_firestore_client()
-        teams_ref = (
-            db.collection("tenants")
-            .document(tenant_id)
-            .collection("teams")
-        )
-        codes: Set[str] = set()
-        for doc in teams_ref.stream():
-            payload = doc.to_dict() or {}
-            code = payload.get("joinCode")
-            if isinstance(code, str):
-                codes.add(code.upper())
-        return codes
 
-    return await asyncio.to_thread(_fetch)
+async def _join_code_exists(tenant_id: str, candidate: str) -> bool:
+    """Check whether a join code is already taken using an indexed point query."""
+    teams_ref = _async_tenant_refs(tenant_id).teams
+    query = teams_ref.where(filter=FieldFilter("joinCode", "==", candidate)).limit(1)
+    async with FIRESTORE_SEMAPHORE:
+        matches = await query.get()
+    return len(matches) > 0
 
 
+@lru_cache(maxsize=1024)
 def _generate_candidate_prefix(team_name: str) -> str:
-    letters = "".join(ch for ch in team_name.upper() if ch.isalpha())
+    letters = "".join(filter(str.isalpha, team_name.upper()))
     if not letters:
         letters = "SQUAD"
     if len(letters) < 5:
@@ -192,72 +345,160 @@ def _generate_candidate_prefix(team_name: str) -> str:
     return letters[:5]
 
 
+# Join codes look like PREFX-123A: 900 numbers x 26 letters per prefix
+_JOIN_CODE_SPACE = 900 * len(string.ascii_uppercase)
+MAX_JOIN_CODE_PROBES = 50
+
+
+def _iter_join_code_candidates(prefix: str, limit: int):
+    """Yield ``limit`` distinct random join codes for ``prefix``."""
+    for index in random.sample(range(_JOIN_CODE_SPACE), limit):
+        numeric, letter = divmod(index, len(string.ascii_uppercase))
+        yield f"{prefix}-{numeric + 100}{string.ascii_uppercase[letter]}"
+
+
 async def generate_unique_join_code(tenant_id: str, team_name: str) -> str:
-    existing_codes = await _fetch_existing_join_codes(tenant_id)
     prefix = _generate_candidate_prefix(team_name)
 
-    for _ in range(50):
-        numeric = random.randint(100, 999)
-        suffix = random.choice(string.ascii_uppercase)
-        candidate = f"{prefix}-{numeric}{suffix}"
-        if candidate not in existing_codes:
+    # Candidates never repeat, so every probe checks a fresh code
+    for candidate in _iter_join_code_candidates(prefix, MAX_JOIN_CODE_PROBES):
+        if not await _join_code_exists(tenant_id, candidate):
             return candidate
 
     raise RuntimeError("Unable to generate a unique join code. Try again.")
 
 
 async def persist_assignment_result(bounty_id: str, assignment: Dict) -> None:
-    """Persist assignment outcome back into Firestore when available."""
-
-    def _persist() -> None:
-        db = get_firestore_client()
-        tenant_ref = db.collection("tenants").document(DEFAULT_TENANT_ID)
+    """Persist assignment outcome back into Firestore when available.
 
-        team_id = assignment.get("assigned_team", {}).get("id")
-        if not team_id:
-            logger.info("Assignment missing team id; skipping Firestore persistence")
-            return
+    Results are queued and whichever task next acquires the Firestore
+    semaphore commits everything queued so far in one WriteBatch, so bursts of
+    assignments coalesce into a few commits instead of one per request.
+    """
+    _pending_assignments.append((bounty_id, assignment))
 
+    def _persist(db, refs: TenantRefs, entries: List[Tuple[str, Dict]]) -> None:
         now = admin_firestore.SERVER_TIMESTAMP
 
-        # Update project document
-        project_ref = tenant_ref.collection("projects").document(bounty_id)
-        project_ref.set(
-            {
-                "status": "assigned",
-                "assignedTeamId": team_id,
-                "updatedAt": now,
-            },
-            merge=True,
-        )
+        # Project status, assignment record and team workload commit atomically
+        batch = db.batch()
+        has_writes = False
+
+        for entry_bounty_id, entry in entries:
+            team_id = entry.get("assigned_team", {}).get("id")
+            if not team_id:
+                logger.info("Assignment missing team id; skipping Firestore persistence")
+                continue
+
+            project_ref = refs.projects.document(entry_bounty_id)
+            batch.set(
+                project_ref,
+                {
+                    "status": "assigned",
+                    "assignedTeamId": team_id,
+                    "updatedAt": now,
+                },
+                merge=True,
+            )
+
+            assignment_payload = {
+                "teamId": team_id,
+                "fitScore": entry.get("fit_score"),
+                "reasoning": entry.get("reasoning"),
+                "createdAt": now,
+                "allScores": entry.get("all_scores", []),
+            }
+            batch.set(project_ref.collection("assignments").document(), assignment_payload)
+
+            team_ref = refs.teams.document(team_id)
+            batch.set(
+                team_ref,
+                {
+                    "current_workload": admin_firestore.Increment(1),
+                    "updatedAt": now,
+                },
+                merge=True,
+            )
+            has_writes = True
 
-        assignment_payload = {
-            "teamId": team_id,
-            "fitScore": assignment.get("fit_score"),
-            "reasoning": assignment.get("reasoning"),
-            "createdAt": now,
-            "allScores": assignment.get("all_scores", []),
-        }
-        project_ref.collection("assignments").add(assignment_payload)
-
-        # Increment team workload
-        team_ref = tenant_ref.collection("teams").document(team_id)
-        team_ref.set(
-            {
-                "current_workload": admin_firestore.Increment(1),
-                "updatedAt": now,
-            },
-            merge=True,
-        )
+        if has_writes:
+            batch.commit()
 
+    entries: List[Tuple[str, Dict]] = []
     try:
-        await asyncio.to_thread(_persist)
+        async with FIRESTORE_SEMAPHORE:
+            if not _pending_assignments:
+                # Already committed as part of another task's batch
+                return
+            entries = _pending_assignments[:MAX_ASSIGNMENTS_PER_BATCH]
+            del _pending_assignments[:MAX_ASSIGNMENTS_PER_BATCH]
+
+            db = _firestore_client()
+            refs = _tenant_refs(DEFAULT_TENANT_ID)
+            await asyncio.to_thread(_persist, db, refs, entries)
+        invalidate_dataset("teams")
+        invalidate_dataset("projects")
     except FirebaseInitializationError:
         logger.debug("Firebase not configured; skipping assignment persistence")
     except exceptions.GoogleCloudError as exc:
-        logger.warning("Firestore error while persisting assignment: %s", exc)
+        logger.warning(
+            "Firestore error while persisting %d assignment(s): %s",
+            len(entries),
+            exc,
+        )
+        _log_dropped_assignments(entries)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning(
+            "Unexpected error persisting %d assignment(s): %s",
+            len(entries),
+            exc,
+        )
+        _log_dropped_assignments(entries)
+
+
+def _log_dropped_assignments(entries: List[Tuple[str, Dict]]) -> None:
+    """Record every assignment lost with a failed batch so it can be replayed."""
+    for bounty_id, assignment in entries:
+        logger.warning(
+            "Dropped assignment for bounty '%s' (team '%s')",
+            bounty_id,
+            assignment.get("assigned_team", {}).get("id"),
+        )
+
+
+# ============================================================================
+# Startup
+# ============================================================================
+
+def init_firestore(app: FastAPI) -> None:
+    """
+    Open the Firestore clients and default tenant references once at boot so
+    the first request does not pay for credential loading and channel setup.
+    """
+    app.state.db = None
+    app.state.async_db = None
+    try:
+        app.state.db = get_firestore_client()
+        app.state.async_db = get_async_firestore_client()
+        _tenant_refs(DEFAULT_TENANT_ID)
+        _async_tenant_refs(DEFAULT_TENANT_ID)
+    except FirebaseInitializationError as exc:
+        logger.warning("Firebase not initialized at startup: %s", exc)
     except Exception as exc:  # pylint: disable=broad-except
-        logger.warning("Unexpected error persisting assignment: %s", exc)
+        logger.error("Unexpected error initializing Firestore: %s", exc)
+
+
+def load_fallback_datasets(app: FastAPI) -> None:
+    """
+    Read the local JSON fixtures once so requests served without Firestore
+    don't hit the disk every time.
+    """
+    app.state.fallback_datasets = {}
+    for json_path in (TEAMS_JSON_PATH, PROJECTS_JSON_PATH):
+        try:
+            app.state.fallback_datasets[json_path] = load_json_file(json_path)
+        except FileNotFoundError as exc:
+            logger.warning("Fallback dataset unavailable: %s", exc)
 
 
 # ============================================================================
@@ -296,15 +537,21 @@ async def health_check():
 
 
 @app.get("/get_teams")
-async def get_teams():
+async def get_teams(request: Request, response: Response):
     """
     Retrieve all teams from teams.json
     
+    Supports conditional requests: a matching If-None-Match returns 304.
+    
     Returns:
         List of team objects with their skills, productivity, and workload info
     """
     try:
         teams = await load_teams()
+        etag = dataset_etag("teams", teams)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=_dataset_cache_headers(etag))
+        response.headers.update(_dataset_cache_headers(etag))
         return {
             "success": True,
             "count": len(teams),
@@ -317,15 +564,21 @@ async def get_teams():
 
 
 @app.get("/get_projects")
-async def get_projects():
+async def get_projects(request: Request, response: Response):
     """
     Retrieve all projects/bounties from projects.json
     
+    Supports conditional requests: a matching If-None-Match returns 304.
+    
     Returns:
         List of bounty objects with descriptions, difficulty, and required skills
     """
     try:
         projects = await load_projects()
+        etag = dataset_etag("projects", projects)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers=_dataset_cache_headers(etag))
+        response.headers.update(_dataset_cache_headers(etag))
         return {
             "success": True,
             "count": len(projects),
@@ -338,7 +591,7 @@ async def get_projects():
 
 
 @app.post("/assign_bounty")
-async def assign_bounty(request: AssignmentRequest):
+async def assign_bounty(request: AssignmentRequest, background_tasks: BackgroundTasks):
     """
     Assign a bounty to the best-fit team using ML scoring algorithm
     
@@ -346,18 +599,23 @@ async def assign_bounty(request: AssignmentRequest):
     - Scores each team based on: skill match (50%), productivity (30%), workload (20%)
     - Returns the highest-scoring team with detailed reasoning
     
+    The assignment is persisted to Firestore after the response is sent.
+    
     Args:
         request: AssignmentRequest with bounty_id
+        background_tasks: Used to schedule Firestore persistence
     
     Returns:
         Assignment result with team, fit score, and reasoning
     """
     try:
         teams, projects = await asyncio.gather(load_teams(), load_projects())
-        result = ml_assign_bounty(
+        # Score off the event loop so other requests are served meanwhile
+        result = await asyncio.to_thread(
+            ml_assign_bounty,
             request.bounty_id,
-            teams_data_path="data/teams.json",
-            projects_data_path="data/projects.json",
+            teams_data_path=TEAMS_JSON_PATH,
+            projects_data_path=PROJECTS_JSON_PATH,
             teams_data=teams,
             projects_data=projects,
         )
@@ -366,7 +624,7 @@ async def assign_bounty(request: AssignmentRequest):
         if "error" in result:
             raise HTTPException(status_code=404, detail=result["error"])
         
-        await persist_assignment_result(request.bounty_id, result)
+        background_tasks.add_task(persist_assignment_result, request.bounty_id, result)
 
         return {
             "success": True,
@@ -397,35 +655,35 @@ async def get_dashboard():
         Dashboard data with metrics and visualizations
     """
     try:
-        teams, projects = await asyncio.gather(load_teams(), load_projects())
+        # Only the difficulty field of each project is needed for the summary
+        teams, projects = await asyncio.gather(
+            load_teams(),
+            load_dataset("projects", PROJECTS_JSON_PATH, field_paths=["difficulty"]),
+        )
         
-        # Calculate metrics
+        # Calculate metrics and the team workload breakdown in a single pass
         total_teams = len(teams)
         total_projects = len(projects)
-        avg_productivity = (
-            sum(float(t.get("productivity_rate", 0)) for t in teams) / total_teams
-            if teams
-            else 0
-        )
-        total_capacity_used = sum(int(t.get("current_workload", 0)) for t in teams)
-        total_capacity = sum(int(t.get("max_capacity", 0)) for t in teams)
-        
-        # Team workload breakdown
-        team_workload = [
-            {
+        total_capacity_used = 0
+        total_capacity = 0
+        productivity_sum = 0.0
+        team_workload = []
+        for t in teams:
+            workload = int(t.get("current_workload", 0))
+            capacity = int(t.get("max_capacity", 0))
+            productivity = float(t.get("productivity_rate", 0))
+            total_capacity_used += workload
+            total_capacity += capacity
+            productivity_sum += productivity
+            team_workload.append({
                 "team_id": t.get("id"),
                 "team_name": t.get("name", "Unnamed Team"),
-                "workload": int(t.get("current_workload", 0)),
-                "capacity": int(t.get("max_capacity", 0)),
-                "utilization": (
-                    (int(t.get("current_workload", 0)) / int(t.get("max_capacity", 0))) * 100
-                    if int(t.get("max_capacity", 0)) > 0
-                    else 0
-                ),
-                "productivity_rate": float(t.get("productivity_rate", 0)),
-            }
-            for t in teams
-        ]
+                "workload": workload,
+                "capacity": capacity,
+                "utilization": (workload / capacity) * 100 if capacity > 0 else 0,
+                "productivity_rate": productivity,
+            })
+        avg_productivity = productivity_sum / total_teams if teams else 0
         
         # Difficulty breakdown of projects
         difficulty_counts = {}
@@ -446,17 +704,15 @@ async def get_dashboard():
                 },
                 "team_workload": team_workload,
                 "bounty_difficulty": difficulty_counts,
-                "top_performers": sorted(
-                    [
-                        {
-                            "name": t.get("name", "Unnamed Team"),
-                            "productivity": float(t.get("productivity_rate", 0)),
-                        }
-                        for t in teams
-                    ],
-                    key=lambda x: x["productivity"],
-                    reverse=True
-                )[:3],
+                "top_performers": [
+                    {
+                        "name": row["team_name"],
+                        "productivity": row["productivity_rate"],
+                    }
+                    for row in heapq.nlargest(
+                        3, team_workload, key=lambda row: row["productivity_rate"]
+                    )
+                ],
                 "timestamp": datetime.now().isoformat()
             }
         }
@@ -484,10 +740,7 @@ async def create_team(request: TeamCreateRequest):
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
     def _create() -> str:
-        db = get_firestore_client()
-        tenant_ref = db.collection("tenants").document(tenant_id)
-        teams_ref = tenant_ref.collection("teams")
-        doc_ref = teams_ref.document()
+        doc_ref = refs.teams.document()
 
         now = admin_firestore.SERVER_TIMESTAMP
         payload = {
@@ -508,12 +761,15 @@ async def create_team(request: TeamCreateRequest):
         return doc_ref.id
 
     try:
-        team_id = await asyncio.to_thread(_create)
+        refs = _tenant_refs(tenant_id)
+        async with FIRESTORE_SEMAPHORE:
+            team_id = await asyncio.to_thread(_create)
     except FirebaseInitializationError as exc:
         raise HTTPException(status_code=503, detail="Firebase not configured.") from exc
     except exceptions.GoogleCloudError as exc:
         raise HTTPException(status_code=500, detail=f"Firestore error: {exc}") from exc
 
+    invalidate_dataset("teams", tenant_id)
     return TeamCreateResponse(success=True, teamId=team_id, joinCode=join_code)
 
 
@@ -534,9 +790,11 @@ if __name__ == "__main__":
     API documentation available at http://localhost:8000/docs
     """)
     
+    # Uvicorn uses uvloop/httptools on its own once they are installed
     uvicorn.run(
-        app,
+        "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+        reload=os.getenv("DEV") == "1",
     )
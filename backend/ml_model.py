@@ -14,9 +14,12 @@ This software may not be copied, modified, distributed, or used without explicit
 """
 
 import json
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Optional
 import os
 
+import numpy as np
+
 
 def load_json_file(file_path: str) -> List[Dict]:
     """Load JSON data from a file."""
@@ -41,14 +44,13 @@ def calculate_skill_match(team_skills: List[str], required_skills: List[str]) ->
         return 1.0
     
     # Convert to lowercase for case-insensitive matching
-    team_skills_lower = [skill.lower() for skill in team_skills]
-    required_skills_lower = [skill.lower() for skill in required_skills]
+    team_skills_lower = frozenset(skill.lower() for skill in team_skills)
     
     # Find matching skills
-    matched_skills = sum(1 for skill in required_skills_lower if skill in team_skills_lower)
+    matched_skills = sum(1 for skill in required_skills if skill.lower() in team_skills_lower)
     
     # Calculate match percentage
-    skill_match = matched_skills / len(required_skills_lower)
+    skill_match = matched_skills / len(required_skills)
     
     return skill_match
 
@@ -77,6 +79,102 @@ def calculate_workload_score(current_workload: int, max_capacity: int) -> float:
     return workload_score
 
 
+@dataclass(frozen=True)
+class TeamMatrix:
+    """Column-oriented view of the teams used for vectorized scoring."""
+    skill_index: Dict[str, int]
+    skills: np.ndarray        # (n_teams, n_skills) bool
+    productivity: np.ndarray  # (n_teams,) float64
+    workload: np.ndarray      # (n_teams,) int64
+    capacity: np.ndarray      # (n_teams,) int64
+    workload_score: np.ndarray  # (n_teams,) float64, see calculate_workload_score
+
+
+# Single-entry cache keyed on the identity of the teams list, so a list served
+# from the backend's dataset cache is only converted once.
+_team_matrix_cache: Optional[Tuple[List[Dict], TeamMatrix]] = None
+
+
+def build_team_matrix(teams: List[Dict]) -> TeamMatrix:
+    """
+    Convert a list of team dicts into a TeamMatrix.
+    
+    Args:
+        teams: List of team objects
+    
+    Returns:
+        TeamMatrix with one row per team, in the same order as ``teams``
+    """
+    skill_index: Dict[str, int] = {}
+    team_skill_ids = []
+    for team in teams:
+        team_skill_ids.append([
+            skill_index.setdefault(skill.lower(), len(skill_index))
+            for skill in team["skills"]
+        ])
+
+    skills = np.zeros((len(teams), len(skill_index)), dtype=bool)
+    for row, ids in enumerate(team_skill_ids):
+        skills[row, ids] = True
+
+    workload = np.array([team["current_workload"] for team in teams], dtype=np.int64)
+    capacity = np.array([team["max_capacity"] for team in teams], dtype=np.int64)
+
+    # Workload score doesn't depend on the bounty, so compute it once per matrix
+    available = np.maximum(capacity - workload, 0)
+    workload_score = np.where(capacity > 0, available / np.maximum(capacity, 1), 0.0)
+
+    return TeamMatrix(
+        skill_index=skill_index,
+        skills=skills,
+        productivity=np.array(
+            [team.get("productivity_rate", 0.5) for team in teams], dtype=np.float64
+        ),
+        workload=workload,
+        capacity=capacity,
+        workload_score=workload_score,
+    )
+
+
+def get_team_matrix(teams: List[Dict]) -> TeamMatrix:
+    """Return the TeamMatrix for ``teams``, reusing it if the list is unchanged."""
+    global _team_matrix_cache
+    if _team_matrix_cache is not None and _team_matrix_cache[0] is teams:
+        return _team_matrix_cache[1]
+    matrix = build_team_matrix(teams)
+    _team_matrix_cache = (teams, matrix)
+    return matrix
+
+
+def score_teams(matrix: TeamMatrix, required_skills: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Score every team at once using the same formulas as calculate_skill_match
+    and calculate_workload_score.
+    
+    Returns:
+        Dict of per-team arrays on a 0-1 scale: final, skill_match, workload
+    """
+    if required_skills:
+        # Skills no team has still count towards the denominator
+        columns = [
+            matrix.skill_index[skill.lower()]
+            for skill in required_skills
+            if skill.lower() in matrix.skill_index
+        ]
+        matched = matrix.skills[:, columns].sum(axis=1)
+        skill_match = matched / len(required_skills)
+    else:
+        skill_match = np.ones(len(matrix.productivity))
+
+    # Apply weights (50% skills, 30% productivity, 20% workload)
+    final = (
+        (skill_match * 0.50) +
+        (matrix.productivity * 0.30) +
+        (matrix.workload_score * 0.20)
+    )
+    return {"final": final, "skill_match": skill_match, "workload": matrix.workload_score}
+
+
 def assign_bounty(
     bounty_id: str,
     teams_data_path: str = "data/teams.json",
@@ -122,46 +220,31 @@ def assign_bounty(
     required_skills = project.get("required_skills", [])
     
     # Score each team
-    team_scores = []
-    
-    for team in teams:
-        # Calculate individual scores
-        skill_match = calculate_skill_match(team["skills"], required_skills)
-        productivity = team.get("productivity_rate", 0.5)
-        workload_score = calculate_workload_score(
-            team["current_workload"],
-            team["max_capacity"]
-        )
-        
-        # Apply weights (50% skills, 30% productivity, 20% workload)
-        weighted_score = (
-            (skill_match * 0.50) +
-            (productivity * 0.30) +
-            (workload_score * 0.20)
-        )
-        
-        # Convert to 0-100 scale
-        final_score = weighted_score * 100
-        
-        team_scores.append({
-            "team": team,
-            "final_score": final_score,
-            "skill_match": skill_match * 100,
-            "productivity": productivity * 100,
-            "workload_score": workload_score * 100
-        })
-    
-    # Sort by score (highest first)
-    team_scores.sort(key=lambda x: x["final_score"], reverse=True)
+    matrix = get_team_matrix(teams)
+    scores = score_teams(matrix, required_skills)
+
+    # Sort by score (highest first); stable so ties keep the input order
+    order = np.argsort(-scores["final"], kind="stable")
+    team_scores = [
+        {
+            "team": teams[i],
+            "final_score": float(scores["final"][i]) * 100,
+            "skill_match": float(scores["skill_match"][i]) * 100,
+            "productivity": float(matrix.productivity[i]) * 100,
+            "workload_score": float(scores["workload"][i]) * 100
+        }
+        for i in order
+    ]
     
     # Check if best team is viable (at least 0 capacity and some relevance)
     best_team_data = team_scores[0]
     best_team = best_team_data["team"]
     
     # Generate reasoning
+    required_skills_lower = frozenset(skill.lower() for skill in required_skills)
     matched_skills = [
         skill for skill in best_team["skills"]
-        if skill.lower() in [s.lower() for s in required_skills]
+        if skill.lower() in required_skills_lower
     ]
     
     reasoning = (
@@ -1,38 +1,41 @@
 """Seed Firebase Authentication with demo accounts.
 
 Usage:
-    python seed_auth_users.py [--reset-passwords]
+    python seed_auth_users.py [--reset-passwords] [--prune [--yes]]
 
 This script uses the Firebase Admin SDK to ensure that the demo accounts used in
 local development exist in Firebase Authentication with deterministic
-passwords. If the user already exists, the script can optionally reset their
-password and update their display name.
+passwords. Existing accounts are looked up in a single request and missing
+ones are created in bulk via auth.import_users with pre-hashed passwords. If the
+user already exists, the script can optionally reset their password and update
+their display name. --prune lists leftover accounts created by this script
+(those carrying the "demo" custom claim); add --yes to delete them.
 """
 
 from __future__ import annotations
 
 import argparse
 import base64
-import importlib
-import json
+import hashlib
 import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+import orjson
 
 try:
-  auth = importlib.import_module("firebase_admin.auth")
-  auth_utils = importlib.import_module("firebase_admin._auth_utils")
-  ConfigurationNotFoundError = getattr(auth_utils, "ConfigurationNotFoundError")
-  google_auth_requests = importlib.import_module("google.auth.transport.requests")
-  AuthorizedSession = getattr(google_auth_requests, "AuthorizedSession")
-  service_account_module = importlib.import_module("google.oauth2.service_account")
+  from firebase_admin import auth
+  from firebase_admin._auth_utils import ConfigurationNotFoundError
+  from google.auth.transport.requests import AuthorizedSession
+  from google.oauth2 import service_account
 except ModuleNotFoundError as exc:  # pragma: no cover - handled at runtime
   raise SystemExit(
     "firebase_admin and google-auth packages are required. Install dependencies via 'pip install -r requirements.txt'."
   ) from exc
 
-service_account = service_account_module
-
 from firebase_client import FirebaseInitializationError, get_firebase_app
 
 
@@ -44,6 +47,8 @@ class DemoUser:
   role: str
 
 
+DEMO_EMAIL_DOMAIN = "@bountyai.dev"
+
 DEMO_USERS: List[DemoUser] = [
   DemoUser(
     email="manager@bountyai.dev",
@@ -60,23 +65,59 @@ DEMO_USERS: List[DemoUser] = [
 ]
 
 
+# Standard scrypt parameters used to pre-hash demo passwords for auth.import_users
+SCRYPT_MEMORY_COST = 2**14
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELIZATION = 1
+SCRYPT_KEY_LENGTH = 64
+
+EMAIL_PROVIDER_DISABLED_MESSAGE = (
+  "Email/password authentication is not enabled for this Firebase project. "
+  "Enable it in the Firebase Console under Authentication → Sign-in method."
+)
+
+
+PASSWORD_HASH_ALGORITHM = auth.UserImportHash.standard_scrypt(
+  memory_cost=SCRYPT_MEMORY_COST,
+  parallelization=SCRYPT_PARALLELIZATION,
+  block_size=SCRYPT_BLOCK_SIZE,
+  derived_key_length=SCRYPT_KEY_LENGTH,
+)
+
+
+def _hash_demo_password(user: DemoUser) -> Tuple[bytes, bytes]:
+  """Return (password_hash, salt) for a demo user using a fresh random salt."""
+  salt = os.urandom(16)
+  password_hash = hashlib.scrypt(
+    user.password.encode("utf-8"),
+    salt=salt,
+    n=SCRYPT_MEMORY_COST,
+    r=SCRYPT_BLOCK_SIZE,
+    p=SCRYPT_PARALLELIZATION,
+    dklen=SCRYPT_KEY_LENGTH,
+  )
+  return password_hash, salt
+
+
+@lru_cache(maxsize=1)
 def _load_service_account_credentials():
+  # Cached base credentials; callers derive scoped copies via with_scopes()
   base64_value = os.getenv("FIREBASE_SERVICE_ACCOUNT_BASE64")
   credential_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
 
   if base64_value:
     try:
-      decoded = base64.b64decode(base64_value).decode("utf-8")
-      data = json.loads(decoded)
+      data = orjson.loads(base64.b64decode(base64_value))
       return service_account.Credentials.from_service_account_info(data)
-    except (ValueError, json.JSONDecodeError) as exc:  # pragma: no cover - configuration issue
+    except ValueError as exc:  # covers binascii.Error and orjson.JSONDecodeError  # pragma: no cover - configuration issue
       raise FirebaseInitializationError("Invalid FIREBASE_SERVICE_ACCOUNT_BASE64 value.") from exc
 
   if credential_path:
     expanded = os.path.expanduser(credential_path)
-    if not os.path.exists(expanded):  # pragma: no cover - configuration issue
-      raise FirebaseInitializationError(f"Service account file not found at {expanded}.")
-    return service_account.Credentials.from_service_account_file(expanded)
+    try:
+      return service_account.Credentials.from_service_account_file(expanded)
+    except FileNotFoundError as exc:  # pragma: no cover - configuration issue
+      raise FirebaseInitializationError(f"Service account file not found at {expanded}.") from exc
 
   raise FirebaseInitializationError(
     "Missing Firebase service account credentials. Set FIREBASE_SERVICE_ACCOUNT_BASE64 or GOOGLE_APPLICATION_CREDENTIALS.",
@@ -90,18 +131,7 @@ def ensure_email_password_provider_enabled(project_id: str) -> None:
   session = AuthorizedSession(credentials)
   base_url = f"https://identitytoolkit.googleapis.com/v1/projects/{project_id}/config"
 
-  response = session.get(base_url)
-  if response.status_code < 400:
-    config = response.json()
-    sign_in = config.get("signIn", {})
-    email_config = sign_in.get("email", {})
-    if email_config.get("enabled"):
-      return
-  elif response.status_code != 404:
-    raise RuntimeError(
-      f"Failed to fetch Identity Toolkit config (status {response.status_code}): {response.text}"
-    )
-
+  # The PATCH is idempotent, so there is no need to read the config first
   patch_payload = {"signIn": {"email": {"enabled": True}}}
   patch_params = {"updateMask": "signIn.email.enabled"}
   patch_response = session.patch(base_url, params=patch_params, json=patch_payload)
@@ -115,36 +145,67 @@ def ensure_email_password_provider_enabled(project_id: str) -> None:
     raise RuntimeError(
       f"Failed to enable email/password provider (status {patch_response.status_code}): {patch_response.text}"
     )
-  print("Enabled Firebase Authentication email/password provider.")
+  print("Firebase Authentication email/password provider is enabled.")
 
 
-def ensure_demo_user(user: DemoUser, *, reset_passwords: bool) -> None:
-  try:
-    new_user = auth.create_user(
+def _demo_claims(user: DemoUser) -> Dict[str, object]:
+  # The "demo" marker is what allows prune_demo_users to delete an account
+  return {"role": user.role, "demo": True}
+
+
+def lookup_users_by_email(emails: List[str]) -> Dict[str, object]:
+  """Fetch existing Auth users in bulk, keyed by lowercase email."""
+  found: Dict[str, object] = {}
+  # get_users accepts at most 100 identifiers per call
+  for start in range(0, len(emails), 100):
+    identifiers = [auth.EmailIdentifier(email) for email in emails[start:start + 100]]
+    try:
+      result = auth.get_users(identifiers)
+    except ConfigurationNotFoundError as error:
+      raise SystemExit(EMAIL_PROVIDER_DISABLED_MESSAGE) from error
+    for record in result.users:
+      found[record.email.lower()] = record
+  return found
+
+
+def create_demo_users(users: List[DemoUser]) -> None:
+  """Create all missing demo users with a single auth.import_users call."""
+  if not users:
+    return
+
+  # scrypt is deliberately slow but releases the GIL, so hash concurrently
+  with ThreadPoolExecutor(max_workers=min(len(users), 8)) as executor:
+    hashes = list(executor.map(_hash_demo_password, users))
+
+  records = [
+    auth.ImportUserRecord(
+      uid=uuid.uuid4().hex,
       email=user.email,
-      password=user.password,
       display_name=user.display_name,
       email_verified=True,
+      custom_claims=_demo_claims(user),
+      password_hash=password_hash,
+      password_salt=salt,
     )
-    auth.set_custom_user_claims(new_user.uid, {"role": user.role})
-    print(f"Created new demo user: {user.email}")
-    return
-  except auth.EmailAlreadyExistsError:
-    pass
-  except ConfigurationNotFoundError as error:
-    raise SystemExit(
-      "Email/password authentication is not enabled for this Firebase project. "
-      "Enable it in the Firebase Console under Authentication → Sign-in method."
-    ) from error
+    for user, (password_hash, salt) in zip(users, hashes)
+  ]
 
-  # User already exists – sync critical fields
   try:
-    record = auth.get_user_by_email(user.email)
+    result = auth.import_users(records, hash_alg=PASSWORD_HASH_ALGORITHM)
   except ConfigurationNotFoundError as error:
-    raise SystemExit(
-      "Email/password authentication is not enabled for this Firebase project. "
-      "Enable it in the Firebase Console under Authentication → Sign-in method."
-    ) from error
+    raise SystemExit(EMAIL_PROVIDER_DISABLED_MESSAGE) from error
+
+  failed = {error.index: error.reason for error in result.errors}
+  for index, user in enumerate(users):
+    if index not in failed:
+      print(f"Created new demo user: {user.email}")
+  if failed:
+    details = "; ".join(f"{users[index].email}: {reason}" for index, reason in failed.items())
+    raise RuntimeError(f"Failed to import demo users: {details}")
+
+
+def sync_demo_user(user: DemoUser, record, *, reset_passwords: bool) -> None:
+  """Bring an existing demo user's profile and claims in line with DEMO_USERS."""
   update_kwargs: Dict[str, object] = {}
 
   if record.display_name != user.display_name:
@@ -156,24 +217,90 @@ def ensure_demo_user(user: DemoUser, *, reset_passwords: bool) -> None:
   if not record.email_verified:
     update_kwargs["email_verified"] = True
 
+  # Claims ride along in the same accounts:update request as the profile fields
+  claims = _demo_claims(user)
+  claims_changed = (record.custom_claims or {}) != claims
+  if claims_changed:
+    update_kwargs["custom_claims"] = claims
+
   if update_kwargs:
     auth.update_user(record.uid, **update_kwargs)
     print(f"Updated existing user: {user.email}")
+    if claims_changed:
+      print(f"  ↳ Set custom claims for {user.email}: {claims}")
   else:
     print(f"User already up to date: {user.email}")
 
-  claims = {"role": user.role}
-  if record.custom_claims != claims:
-    auth.set_custom_user_claims(record.uid, claims)
-    print(f"  ↳ Set custom claims for {user.email}: {claims}")
-
 
 def seed_auth_users(reset_passwords: bool) -> None:
   # Ensure Firebase Admin is initialized before interacting with auth
   get_firebase_app()
 
-  for user in DEMO_USERS:
-    ensure_demo_user(user, reset_passwords=reset_passwords)
+  # Resolve every demo account up front, then branch to create vs update locally
+  existing = lookup_users_by_email([user.email for user in DEMO_USERS])
+
+  create_demo_users([user for user in DEMO_USERS if user.email.lower() not in existing])
+
+  to_sync = [user for user in DEMO_USERS if user.email.lower() in existing]
+  if not to_sync:
+    return
+  with ThreadPoolExecutor(max_workers=min(len(to_sync), 8)) as executor:
+    futures = [
+      executor.submit(sync_demo_user, user, existing[user.email.lower()], reset_passwords=reset_passwords)
+      for user in to_sync
+    ]
+    for future in futures:
+      future.result()
+
+
+def _iter_users_fast(max_results: int = 1000):
+  """Yield every Auth user by following page tokens directly.
+
+  ListUsersPage.users rebuilds its list on every access, and iterate_all()
+  touches it repeatedly per item, so each page's users are read exactly once.
+  """
+  page = auth.list_users(max_results=max_results)
+  while page is not None:
+    users = page.users
+    yield from users
+    page = page.get_next_page()
+
+
+def prune_demo_users(*, confirm: bool) -> None:
+  """Delete demo-marked accounts that are no longer listed in DEMO_USERS.
+
+  Only accounts carrying the ``demo`` custom claim set by this script are
+  considered, so real users on the same domain are never touched. Without
+  ``confirm`` the candidates are only listed.
+  """
+  keep = {user.email for user in DEMO_USERS}
+  stale = [
+    record
+    for record in _iter_users_fast()
+    if (record.custom_claims or {}).get("demo") is True
+    and record.email
+    and record.email.endswith(DEMO_EMAIL_DOMAIN)
+    and record.email not in keep
+  ]
+  if not stale:
+    print("No stale demo users to prune.")
+    return
+
+  for record in stale:
+    print(f"Stale demo user: {record.email} ({record.uid})")
+  if not confirm:
+    print("Dry run only; re-run with --prune --yes to delete these accounts.")
+    return
+
+  uids = [record.uid for record in stale]
+  deleted = 0
+  # delete_users accepts at most 1000 uids per call
+  for start in range(0, len(uids), 1000):
+    result = auth.delete_users(uids[start:start + 1000])
+    deleted += result.success_count
+    for error in result.errors:
+      print(f"  ↳ Failed to delete user at index {start + error.index}: {error.reason}")
+  print(f"Pruned {deleted} stale demo user(s).")
 
 
 def main() -> None:
@@ -183,6 +310,16 @@ def main() -> None:
     action="store_true",
     help="Reset passwords for existing demo users to match the defaults",
   )
+  parser.add_argument(
+    "--prune",
+    action="store_true",
+    help="List demo-marked accounts that are no longer in the demo user list",
+  )
+  parser.add_argument(
+    "--yes",
+    action="store_true",
+    help="With --prune, actually delete the listed accounts",
+  )
   args = parser.parse_args()
 
   try:
@@ -192,6 +329,8 @@ def main() -> None:
 
     ensure_email_password_provider_enabled(project_id)
     seed_auth_users(reset_passwords=args.reset_passwords)
+    if args.prune:
+      prune_demo_users(confirm=args.yes)
   except FirebaseInitializationError as exc:
     raise SystemExit(
       "Firebase Admin SDK is not configured. Ensure backend/.env contains valid credentials."
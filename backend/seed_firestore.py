@@ -18,10 +18,14 @@ append to the "assignments" sub-collection.
 from __future__ import annotations
 
 import argparse
-import json
 import os
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Sequence
+from typing import Any, Dict, List, Sequence, Tuple
+
+import orjson
 
 from firebase_client import FirebaseInitializationError, get_firestore_client
 
@@ -36,17 +40,92 @@ COLLECTION_DATASETS = {
 
 ASSIGNMENTS_FILENAME = "assignments.json"
 
+# Attempts per write (including the first) before BulkWriter gives up on it;
+# matches the SDK's own default
+MAX_WRITE_ATTEMPTS = 15
+
+# (document path, status code, message) for a write BulkWriter gave up on
+WriteFailure = Tuple[str, Any, str]
+
+
+_DB = None
+
+
+def _db():
+    """Resolve the Firestore client once for the whole seeding run."""
+    global _DB
+    if _DB is None:
+        _DB = get_firestore_client()
+    return _DB
+
 
 def load_json(path: Path) -> Any:
-    if not path.exists():
-        raise FileNotFoundError(f"Seed file not found: {path}")
-    with path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Seed file not found: {path}") from exc
+    return orjson.loads(raw)
+
+
+def _new_document_id() -> str:
+    """Random 20-character id, the same length Firestore uses for auto-ids."""
+    return uuid.uuid4().hex[:20]
+
 
+def _new_bulk_writer(failures: List[WriteFailure]):
+    """BulkWriter that retries failed writes and records the ones it gives up on.
+
+    BulkWriter never raises for failed writes, so callers must check
+    ``failures`` (see _raise_for_failures) after flush() or close().
+    """
+    bulk_writer = _db().bulk_writer()
+
+    def _on_write_error(failure, _writer) -> bool:
+        if failure.attempts < MAX_WRITE_ATTEMPTS:
+            return True
+        failures.append(
+            (failure.operation.reference.path, failure.code, failure.message)
+        )
+        return False
 
-def _delete_collection(collection_ref) -> None:
-    for doc in list(collection_ref.stream()):
-        doc.reference.delete()
+    bulk_writer.on_write_error(_on_write_error)
+    return bulk_writer
+
+
+def _raise_for_failures(failures: List[WriteFailure]) -> None:
+    if not failures:
+        return
+    details = "; ".join(f"{path} ({code}: {message})" for path, code, message in failures[:10])
+    if len(failures) > 10:
+        details += f"; and {len(failures) - 10} more"
+    raise RuntimeError(f"{len(failures)} Firestore write(s) failed: {details}")
+
+
+def _delete_collection(collection_ref, batch_size: int = 500) -> None:
+    """Delete every document in a collection, one page of references at a time."""
+    previous_first_id = None
+    while True:
+        docs = list(collection_ref.limit(batch_size).stream())
+        if not docs:
+            break
+        # A page that starts where the last one did means its deletes didn't land
+        if docs[0].id == previous_first_id:
+            raise RuntimeError(
+                f"Deleting {collection_ref.id} made no progress at document {previous_first_id}"
+            )
+        previous_first_id = docs[0].id
+        # A fresh writer per page: flush() shuts the writer down, so nothing queued
+        # after it would ever be sent. close() lands the deletes before the next query.
+        failures: List[WriteFailure] = []
+        bulk_writer = _new_bulk_writer(failures)
+        try:
+            for doc in docs:
+                bulk_writer.delete(doc.reference)
+        finally:
+            bulk_writer.close()
+        _raise_for_failures(failures)
+        if len(docs) < batch_size:
+            break
 
 
 def _seed_primary_collection(
@@ -54,60 +133,89 @@ def _seed_primary_collection(
     collection: str,
     payload: Sequence[Dict],
     reset: bool = False,
+    bulk_writer=None,
 ) -> None:
-    db = get_firestore_client()
+    db = _db()
     tenant_ref = db.collection("tenants").document(tenant)
     collection_ref = tenant_ref.collection(collection)
 
     if reset:
         _delete_collection(collection_ref)
 
-    batch = db.batch()
+    # BulkWriter pipelines writes in parallel and has no 500-op batch limit.
+    # A shared writer is drained by the caller; otherwise use (and close) our own.
+    owns_writer = bulk_writer is None
+    failures: List[WriteFailure] = []
+    if owns_writer:
+        bulk_writer = _new_bulk_writer(failures)
+    document = collection_ref.document
     for entry in payload:
-        doc_id = entry.get("id") or collection_ref.document().id
-        cleansed = {**entry}
-        batch.set(collection_ref.document(doc_id), cleansed)
+        doc_id = entry.get("id") or _new_document_id()
+        bulk_writer.set(document(doc_id), entry)
 
-    batch.commit()
+    if owns_writer:
+        bulk_writer.close()
+        _raise_for_failures(failures)
 
 
 def seed_tenant_document(tenant: str, payload: Dict) -> None:
-    db = get_firestore_client()
+    db = _db()
     tenant_id = payload.get("id") or tenant
     doc_data = {k: v for k, v in payload.items() if k != "id"}
     db.collection("tenants").document(tenant_id).set(doc_data, merge=True)
 
 
+def reset_assignments(tenant: str) -> None:
+    """Delete the assignments sub-collection of every project in the tenant.
+
+    Call it before the projects are reset or reseeded, so it still sees them.
+    """
+    projects_ref = _db().collection("tenants").document(tenant).collection("projects")
+    for project_doc in projects_ref.stream():
+        _delete_collection(project_doc.reference.collection("assignments"))
+
+
 def seed_assignments(
     tenant: str,
     assignments: Sequence[Dict],
     reset: bool = False,
+    bulk_writer=None,
 ) -> None:
     if not assignments:
         return
 
-    db = get_firestore_client()
+    # Validate everything before any write is queued
+    if not all(entry.get("projectId") for entry in assignments):
+        raise ValueError("Assignment entry missing projectId")
+
+    by_project: Dict[str, List[Dict]] = defaultdict(list)
+    for entry in assignments:
+        by_project[entry["projectId"]].append(entry)
+
+    db = _db()
     tenant_ref = db.collection("tenants").document(tenant)
     projects_ref = tenant_ref.collection("projects")
 
     if reset:
-        for project_doc in projects_ref.stream():
-            _delete_collection(project_doc.reference.collection("assignments"))
+        reset_assignments(tenant)
 
-    batch = db.batch()
-    for entry in assignments:
-        project_id = entry.get("projectId")
-        if not project_id:
-            raise ValueError("Assignment entry missing projectId")
-
-        payload = {**entry, "tenantId": entry.get("tenantId") or tenant}
-        assignment_id = entry.get("id") or projects_ref.document(project_id).collection("assignments").document().id
-        batch.set(
-            projects_ref.document(project_id).collection("assignments").document(assignment_id),
-            payload,
-        )
+    owns_writer = bulk_writer is None
+    failures: List[WriteFailure] = []
+    if owns_writer:
+        bulk_writer = _new_bulk_writer(failures)
+
+    for project_id, entries in by_project.items():
+        assignments_ref = projects_ref.document(project_id).collection("assignments")
+        for entry in entries:
+            # Entries come straight from the parsed fixture, so tag them in place
+            if not entry.get("tenantId"):
+                entry["tenantId"] = tenant
+            assignment_id = entry.get("id") or _new_document_id()
+            bulk_writer.set(assignments_ref.document(assignment_id), entry)
 
-    batch.commit()
+    if owns_writer:
+        bulk_writer.close()
+        _raise_for_failures(failures)
 
 
 def main() -> None:
@@ -121,31 +229,56 @@ def main() -> None:
     if not data_dir.exists():
         raise FileNotFoundError(f"Data directory not found: {data_dir}")
 
+    assignments_path = data_dir / ASSIGNMENTS_FILENAME
+
     try:
-        tenant_path = data_dir / TENANT_FILENAME
-        if tenant_path.exists():
-            tenant_payload = load_json(tenant_path)
-            if isinstance(tenant_payload, list):
-                raise ValueError("tenant.json must be a single JSON object, not an array")
-            if not isinstance(tenant_payload, dict):
-                raise ValueError("tenant.json must be a JSON object")
-            seed_tenant_document(args.tenant, tenant_payload)
-
-        for collection, filename in COLLECTION_DATASETS.items():
-            dataset_path = data_dir / filename
-            if not dataset_path.exists():
-                continue
-            items = load_json(dataset_path)
-            if not isinstance(items, list):
-                raise ValueError(f"{filename} must contain an array of objects")
-            _seed_primary_collection(args.tenant, collection, items, reset=args.reset)
-
-        assignments_path = data_dir / ASSIGNMENTS_FILENAME
-        if assignments_path.exists():
-            assignments = load_json(assignments_path)
-            if not isinstance(assignments, list):
-                raise ValueError("assignments.json must contain an array of objects")
-            seed_assignments(args.tenant, assignments, reset=args.reset)
+        if args.reset and assignments_path.exists():
+            # Clear assignments while the existing projects are still listed,
+            # before the shared writer below has anything queued
+            reset_assignments(args.tenant)
+
+        # One writer for every collection so its in-flight window spans the whole run
+        failures: List[WriteFailure] = []
+        bulk_writer = _new_bulk_writer(failures)
+        try:
+            with ThreadPoolExecutor(max_workers=len(COLLECTION_DATASETS)) as executor:
+                # Parse every fixture up front so parsing overlaps with Firestore writes
+                pending = {
+                    collection: executor.submit(load_json, data_dir / filename)
+                    for collection, filename in COLLECTION_DATASETS.items()
+                }
+
+                tenant_path = data_dir / TENANT_FILENAME
+                if tenant_path.exists():
+                    tenant_payload = load_json(tenant_path)
+                    if isinstance(tenant_payload, list):
+                        raise ValueError("tenant.json must be a single JSON object, not an array")
+                    if not isinstance(tenant_payload, dict):
+                        raise ValueError("tenant.json must be a JSON object")
+                    seed_tenant_document(args.tenant, tenant_payload)
+
+                for collection, future in pending.items():
+                    try:
+                        items = future.result()
+                    except FileNotFoundError:
+                        # Optional dataset; skip collections without a fixture
+                        continue
+                    if not isinstance(items, list):
+                        raise ValueError(
+                            f"{COLLECTION_DATASETS[collection]} must contain an array of objects"
+                        )
+                    _seed_primary_collection(
+                        args.tenant, collection, items, reset=args.reset, bulk_writer=bulk_writer
+                    )
+
+            if assignments_path.exists():
+                assignments = load_json(assignments_path)
+                if not isinstance(assignments, list):
+                    raise ValueError("assignments.json must contain an array of objects")
+                seed_assignments(args.tenant, assignments, bulk_writer=bulk_writer)
+        finally:
+            bulk_writer.close()
+        _raise_for_failures(failures)
 
         print(
             "Seeded tenant document, collections "
@@ -157,6 +290,8 @@ def main() -> None:
         raise SystemExit(
             "Firebase Admin SDK is not configured. Ensure backend/.env is populated with credentials."
         ) from exc
+    except RuntimeError as exc:
+        raise SystemExit(str(exc)) from exc
 
 
 if __name__ == "__main__":